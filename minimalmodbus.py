@@ -28,12 +28,13 @@ if sys.version_info < (3, 8, 0):
         "Your Python version is too old for this version of MinimalModbus"
     )
 
+import array
 import binascii
 import enum
 import os
 import struct
 import time
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
 
 import serial
 
@@ -50,13 +51,20 @@ _BROADCAST_DELAY: float = 0.2  # seconds
 _BITS_PER_BYTE = 8
 _ASCII_HEADER = b":"
 _ASCII_FOOTER = b"\r\n"
-_BYTEPOSITION_FOR_ASCII_HEADER = 0  # Relative to plain response
 _BYTEPOSITION_FOR_SLAVEADDRESS = 0  # Relative to (stripped) response
 _BYTEPOSITION_FOR_FUNCTIONCODE = 1  # Relative to (stripped) response
 _BYTEPOSITION_FOR_SLAVE_ERROR_CODE = 2  # Relative to (stripped) response
 _BITNUMBER_FUNCTIONCODE_ERRORINDICATION = 7
 _SLAVEADDRESS_BROADCAST = 0
 
+# Precompiled formats for two-byte values. Key: (lsb_first, signed)
+_TWO_BYTES_STRUCTS: Dict[Tuple[bool, bool], struct.Struct] = {
+    (False, False): struct.Struct(">H"),  # Big-endian unsigned short
+    (False, True): struct.Struct(">h"),  # Big-endian signed short
+    (True, False): struct.Struct("<H"),  # Little-endian unsigned short
+    (True, True): struct.Struct("<h"),  # Little-endian signed short
+}
+
 # Several instrument instances can share the same serialport
 _serialports: Dict[str, serial.Serial] = {}  # Key: port name, value: port instance
 _latest_read_times: Dict[str, float] = {}  # Key: port name, value: timestamp
@@ -1852,12 +1860,12 @@ def _extract_payload(
 
     if mode == MODE_ASCII:
         # Validate the ASCII header and footer.
-        if response[_BYTEPOSITION_FOR_ASCII_HEADER].to_bytes(1, "big") != _ASCII_HEADER:
+        if not response.startswith(_ASCII_HEADER):
             raise InvalidResponseError(
                 "Did not find header ({!r}) as start ".format(_ASCII_HEADER)
                 + "of ASCII response. The plain response is: {!r}".format(response)
             )
-        if response[-len(_ASCII_FOOTER) :] != _ASCII_FOOTER:
+        if not response.endswith(_ASCII_FOOTER):
             raise InvalidResponseError(
                 "Did not find footer "
                 + "({!r}) as end of ASCII response. The plain response is: {!r}".format(
@@ -2129,16 +2137,14 @@ def _num_to_two_bytes(
     multiplier = 10**number_of_decimals
     integer = int(float(value) * multiplier)
 
-    if lsb_first:
-        formatcode = "<"  # Little-endian
-    else:
-        formatcode = ">"  # Big-endian
-    if signed:
-        formatcode += "h"  # (Signed) short (2 bytes)
-    else:
-        formatcode += "H"  # Unsigned short (2 bytes)
+    packer = _TWO_BYTES_STRUCTS[(lsb_first, signed)]
+    try:
+        outbytes = packer.pack(integer)
+    except struct.error as exc:
+        errortext = "The value to send is probably out of range, as the num-to-bytes "
+        errortext += "conversion failed. Value: {0!r} Struct format code is: {1}"
+        raise ValueError(errortext.format(integer, packer.format)) from exc
 
-    outbytes = _pack_bytes(formatcode, integer)
     assert len(outbytes) == 2
     return outbytes
 
@@ -2184,13 +2190,8 @@ def _two_bytes_to_num(
     )
     _check_bool(signed, description="signed parameter")
 
-    formatcode = ">"  # Big-endian
-    if signed:
-        formatcode += "h"  # (Signed) short (2 bytes)
-    else:
-        formatcode += "H"  # Unsigned short (2 bytes)
-
-    fullregister: int = _unpack_bytes(formatcode, inputbytes)
+    # The length is checked above, so unpacking will not fail
+    fullregister: int = _TWO_BYTES_STRUCTS[(False, signed)].unpack(inputbytes)[0]
 
     if number_of_decimals == 0:
         return fullregister
@@ -2231,29 +2232,27 @@ def _long_to_bytes(
         byteorder, minvalue=0, maxvalue=_MAX_BYTEORDER_VALUE, description="byteorder"
     )
 
+    endianness: Literal["big", "little"]
     if byteorder in [BYTEORDER_BIG, BYTEORDER_BIG_SWAP]:
-        formatcode = ">"
-    else:
-        formatcode = "<"
-    if number_of_registers == 2 and signed:
-        formatcode += "l"  # (Signed) long (4 bytes)
-        lengthtarget = 4
-    elif number_of_registers == 2:
-        formatcode += "L"  # Unsigned long (4 bytes)
-        lengthtarget = 4
-    elif number_of_registers == 4 and signed:
-        formatcode += "q"  # (Signed) long long (8 bytes)
-        lengthtarget = 8
-    elif number_of_registers == 4:
-        formatcode += "Q"  # Unsigned long long (8 bytes)
-        lengthtarget = 8
+        endianness = "big"
     else:
+        endianness = "little"
+
+    if number_of_registers not in [2, 4]:
         raise ValueError(
             "Wrong number of registers! Given value is {0!r}".format(
                 number_of_registers
             )
         )
-    outputbytes = _pack_bytes(formatcode, value)
+    lengthtarget = number_of_registers * _NUMBER_OF_BYTES_PER_REGISTER  # 4 or 8
+
+    try:
+        outputbytes = value.to_bytes(lengthtarget, endianness, signed=signed)
+    except OverflowError as exc:
+        errortext = "The value to send is out of range for {} bytes (signed: {}). "
+        errortext += "Value: {!r}"
+        raise ValueError(errortext.format(lengthtarget, signed, value)) from exc
+
     if byteorder in [BYTEORDER_BIG_SWAP, BYTEORDER_LITTLE_SWAP]:
         outputbytes = _swap(outputbytes)
 
@@ -2293,28 +2292,19 @@ def _bytes_to_long(
         byteorder, minvalue=0, maxvalue=_MAX_BYTEORDER_VALUE, description="byteorder"
     )
 
+    endianness: Literal["big", "little"]
     if byteorder in [BYTEORDER_BIG, BYTEORDER_BIG_SWAP]:
-        formatcode = ">"
-    else:
-        formatcode = "<"
-    if number_of_registers == 2 and signed:
-        formatcode += "l"  # (Signed) long (4 bytes)
-        lengthtarget = 4
-    elif number_of_registers == 2:
-        formatcode += "L"  # Unsigned long (4 bytes)
-        lengthtarget = 4
-    elif number_of_registers == 4 and signed:
-        formatcode += "q"  # (Signed) long long (8 bytes)
-        lengthtarget = 8
-    elif number_of_registers == 4:
-        formatcode += "Q"  # Unsigned long long (8 bytes)
-        lengthtarget = 8
+        endianness = "big"
     else:
+        endianness = "little"
+
+    if number_of_registers not in [2, 4]:
         raise ValueError(
             "Wrong number of registers! Given value is {0!r}".format(
                 number_of_registers
             )
         )
+    lengthtarget = number_of_registers * _NUMBER_OF_BYTES_PER_REGISTER  # 4 or 8
     _check_bytes(
         inputbytes, "input bytes", minlength=lengthtarget, maxlength=lengthtarget
     )
@@ -2322,7 +2312,7 @@ def _bytes_to_long(
     if byteorder in [BYTEORDER_BIG_SWAP, BYTEORDER_LITTLE_SWAP]:
         inputbytes = _swap(inputbytes)
 
-    return int(_unpack_bytes(formatcode, inputbytes))
+    return int.from_bytes(inputbytes, endianness, signed=signed)
 
 
 def _float_to_bytes(
@@ -2559,9 +2549,8 @@ def _valuelist_to_bytes(valuelist: List[int], number_of_registers: int) -> bytes
 
     number_of_bytes = _NUMBER_OF_BYTES_PER_REGISTER * number_of_registers
 
-    outputbytes = b""
-    for value in valuelist:
-        outputbytes += _num_to_two_bytes(value, signed=False)
+    # The values are checked above. Pack all of them as big-endian unsigned shorts.
+    outputbytes = struct.pack(">{}H".format(number_of_registers), *valuelist)
 
     assert len(outputbytes) == number_of_bytes
     return outputbytes
@@ -2588,13 +2577,8 @@ def _bytes_to_valuelist(inputbytes: bytes, number_of_registers: int) -> List[int
         inputbytes, "input bytes", minlength=number_of_bytes, maxlength=number_of_bytes
     )
 
-    values = []
-    for i in range(number_of_registers):
-        offset = _NUMBER_OF_BYTES_PER_REGISTER * i
-        sub_bytes = inputbytes[offset : (offset + _NUMBER_OF_BYTES_PER_REGISTER)]
-        values.append(int(_two_bytes_to_num(sub_bytes)))
-
-    return values
+    # Unpack all registers as big-endian unsigned shorts. The length is checked above.
+    return list(struct.unpack(">{}H".format(number_of_registers), inputbytes))
 
 
 def _pack_bytes(formatstring: str, value: Any) -> bytes:
@@ -2671,12 +2655,10 @@ def _swap(inputbytes: bytes) -> bytes:
                 inputbytes
             )
         )
-    templist = list(inputbytes)
-    templist[1:length:2], templist[:length:2] = (
-        templist[:length:2],
-        templist[1:length:2],
-    )
-    return bytes(templist)
+    # Reverse the byte order within each 16-bit item, regardless of host endianness
+    temparray = array.array("H", inputbytes)
+    temparray.byteswap()
+    return temparray.tobytes()
 
 
 def _hexencode(inputbytes: bytes, insert_spaces: bool = False) -> bytes:
@@ -2753,9 +2735,7 @@ def _describe_bytes(inputbytes: bytes) -> str:
     Returns a space separated descriptive string.
     For example ``b'\x01\x02\x03'`` gives: ``01 02 03 (3 bytes)``
     """
-    return " ".join([f"{x:02X}" for x in inputbytes]) + " ({} bytes)".format(
-        len(inputbytes)
-    )
+    return inputbytes.hex(" ").upper() + " ({} bytes)".format(len(inputbytes))
 
 
 def _calculate_number_of_bytes_for_bits(number_of_bits: int) -> int:
@@ -2770,10 +2750,8 @@ def _calculate_number_of_bytes_for_bits(number_of_bits: int) -> int:
 
     Algorithm from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
     """
-    result = number_of_bits // _BITS_PER_BYTE  # Integer division in Python2 and 3
-    if number_of_bits % _BITS_PER_BYTE:
-        result += 1
-    return result
+    # Integer division, rounding up
+    return (number_of_bits + _BITS_PER_BYTE - 1) // _BITS_PER_BYTE
 
 
 def _bit_to_bytes(value: int) -> bytes:
@@ -2820,18 +2798,20 @@ def _bits_to_bytes(valuelist: List[int]) -> bytes:
                 "Wrong value in list of bits. " + "Given: {!r}".format(value)
             )
 
-    list_position = 0
-    outputbytes = b""
-    while list_position < len(valuelist):
-        sublist = valuelist[list_position : (list_position + _BITS_PER_BYTE)]
+    # The first bit in the list is the least significant bit in the first byte
+    combinedvalue = 0
+    for bitposition, value in enumerate(valuelist):
+        combinedvalue |= value << bitposition
 
-        bytevalue = 0
-        for bitposition, value in enumerate(sublist):
-            bytevalue |= value << bitposition
-        outputbytes += bytevalue.to_bytes(1, "big")
+    number_of_bytes = _calculate_number_of_bytes_for_bits(len(valuelist))
+    return combinedvalue.to_bytes(number_of_bytes, "little")
 
-        list_position += _BITS_PER_BYTE
-    return outputbytes
+
+_BITS_FOR_BYTEVALUE = tuple(
+    tuple((bytevalue >> bitposition) & 1 for bitposition in range(_BITS_PER_BYTE))
+    for bytevalue in range(256)
+)
+"""The bits (least significant bit first) for each of the 256 byte values."""
 
 
 def _bytes_to_bits(inputbytes: bytes, number_of_bits: int) -> List[int]:
@@ -2861,11 +2841,9 @@ def _bytes_to_bits(inputbytes: bytes, number_of_bits: int) -> List[int]:
                 expected_length, number_of_bits, len(inputbytes)
             )
         )
-    total_list = []
+    total_list: List[int] = []
     for bytevalue in inputbytes:  # Gives individual bytes as int
-        for bitposition in range(_BITS_PER_BYTE):
-            bitvalue = (bytevalue & (1 << bitposition)) > 0
-            total_list.append(int(bitvalue))
+        total_list.extend(_BITS_FOR_BYTEVALUE[bytevalue])
     return total_list[:number_of_bits]
 
 
@@ -2900,7 +2878,7 @@ def _twos_complement(x: int, bits: int = 16) -> int:
     -1   255
     ==== =======
     """
-    _check_int(bits, minvalue=0, description="number of bits")
+    _check_int(bits, minvalue=1, description="number of bits")
     _check_int(x, description="input")
     upperlimit: int = 2 ** (bits - 1) - 1
     lowerlimit: int = -(2 ** (bits - 1))
@@ -2912,10 +2890,9 @@ def _twos_complement(x: int, bits: int = 16) -> int:
             )
         )
 
-    # Calculate two'2 complement
-    if x >= 0:
-        return x
-    return int(x + 2**bits)
+    # Calculate two's complement. Keeping the lowest bits maps negative values
+    # to the upper range, and leaves the non-negative values unchanged.
+    return x & ((1 << bits) - 1)
 
 
 def _from_twos_complement(x: int, bits: int = 16) -> int:
@@ -2941,7 +2918,7 @@ def _from_twos_complement(x: int, bits: int = 16) -> int:
     255 -1
     === =======
     """
-    _check_int(bits, minvalue=0, description="number of bits")
+    _check_int(bits, minvalue=1, description="number of bits")
 
     _check_int(x, description="input")
     upperlimit = 2 ** (bits) - 1
@@ -2954,11 +2931,10 @@ def _from_twos_complement(x: int, bits: int = 16) -> int:
             )
         )
 
-    # Calculate inverse(?) of two'2 complement
-    limit = 2 ** (bits - 1) - 1
-    if x <= limit:
-        return x
-    return int(x - 2**bits)
+    # Calculate inverse(?) of two's complement. Flipping the sign bit and then
+    # subtracting its weight maps the upper range to negative values.
+    signbit = 1 << (bits - 1)
+    return (x ^ signbit) - signbit
 
 
 # ################ #
@@ -3290,7 +3266,7 @@ Built with this code::
         if not i%11:
             output += "\n"
         output += "{:5.0f}, ".format(m)
-    print output
+    print(output)
 """
 
 
@@ -3321,7 +3297,8 @@ def _calculate_crc(inputbytes: bytes) -> bytes:
     for current_byte in inputbytes:
         register = (register >> 8) ^ _CRC16TABLE[(register ^ current_byte) & 0xFF]
 
-    return _num_to_two_bytes(register, lsb_first=True)
+    # The register is always in range, so skip the checks in _num_to_two_bytes()
+    return register.to_bytes(2, "little")
 
 
 def _calculate_lrc(inputbytes: bytes) -> bytes:
@@ -3348,9 +3325,7 @@ def _calculate_lrc(inputbytes: bytes) -> bytes:
     """
     _check_bytes(inputbytes, description="LRC input bytes")
 
-    register = 0
-    for bytevalue in inputbytes:
-        register += bytevalue
+    register = sum(inputbytes)
 
     lrc = ((register ^ 0xFF) + 1) & 0xFF
 
@@ -3534,6 +3509,25 @@ def _check_response_payload(
             )
 
 
+_SLAVE_NON_ERRORS = (5,)  # Acknowledge
+
+# Key: slave error code, value: exception type and error message
+_SLAVE_ERRORS: Dict[int, Tuple[Type[SlaveReportedException], str]] = {
+    1: (IllegalRequestError, "Slave reported illegal function"),
+    2: (IllegalRequestError, "Slave reported illegal data address"),
+    3: (IllegalRequestError, "Slave reported illegal data value"),
+    4: (SlaveReportedException, "Slave reported device failure"),
+    6: (SlaveDeviceBusyError, "Slave reported device busy"),
+    7: (NegativeAcknowledgeError, "Slave reported negative acknowledge"),
+    8: (SlaveReportedException, "Slave reported memory parity error"),
+    10: (SlaveReportedException, "Slave reported gateway path unavailable"),
+    11: (
+        SlaveReportedException,
+        "Slave reported gateway target device failed to respond",
+    ),
+}
+
+
 def _check_response_slaveerrorcode(response: bytes) -> None:
     """Check if the slave indicates an error.
 
@@ -3549,21 +3543,6 @@ def _check_response_slaveerrorcode(response: bytes) -> None:
     Raises:
         SlaveReportedException or subclass
     """
-    NON_ERRORS = [5]
-    SLAVE_ERRORS = {
-        1: IllegalRequestError("Slave reported illegal function"),
-        2: IllegalRequestError("Slave reported illegal data address"),
-        3: IllegalRequestError("Slave reported illegal data value"),
-        4: SlaveReportedException("Slave reported device failure"),
-        6: SlaveDeviceBusyError("Slave reported device busy"),
-        7: NegativeAcknowledgeError("Slave reported negative acknowledge"),
-        8: SlaveReportedException("Slave reported memory parity error"),
-        10: SlaveReportedException("Slave reported gateway path unavailable"),
-        11: SlaveReportedException(
-            "Slave reported gateway target device failed to respond"
-        ),
-    }
-
     if len(response) < _BYTEPOSITION_FOR_SLAVE_ERROR_CODE + 1:
         return  # This check is also done before calling, do not raise exception here.
 
@@ -3572,16 +3551,15 @@ def _check_response_slaveerrorcode(response: bytes) -> None:
     if _check_bit(received_functioncode, _BITNUMBER_FUNCTIONCODE_ERRORINDICATION):
         slave_error_code = response[_BYTEPOSITION_FOR_SLAVE_ERROR_CODE]
 
-        if slave_error_code in NON_ERRORS:
+        if slave_error_code in _SLAVE_NON_ERRORS:
             return
 
-        error = SLAVE_ERRORS.get(
-            slave_error_code,
-            SlaveReportedException(
-                "Slave reported error code " + str(slave_error_code)
-            ),
+        if slave_error_code in _SLAVE_ERRORS:
+            exception_type, errortext = _SLAVE_ERRORS[slave_error_code]
+            raise exception_type(errortext)
+        raise SlaveReportedException(
+            "Slave reported error code " + str(slave_error_code)
         )
-        raise error
 
 
 def _check_response_bytecount(payload: bytes) -> None:
@@ -3638,10 +3616,12 @@ def _check_response_registeraddress(payload: bytes, registeraddress: int) -> Non
     )
     _check_registeraddress(registeraddress)
 
-    BYTERANGE_FOR_STARTADDRESS = slice(0, 2)
+    POSITION_FOR_STARTADDRESS = 0
 
-    bytes_for_startaddress = payload[BYTERANGE_FOR_STARTADDRESS]
-    received_startaddress = _two_bytes_to_num(bytes_for_startaddress)
+    # Big-endian unsigned short. The payload length is checked above.
+    received_startaddress = _TWO_BYTES_STRUCTS[(False, False)].unpack_from(
+        payload, POSITION_FOR_STARTADDRESS
+    )[0]
 
     if received_startaddress != registeraddress:
         raise InvalidResponseError(
@@ -3678,12 +3658,12 @@ def _check_response_number_of_registers(
         description="number of registers",
     )
 
-    BYTERANGE_FOR_NUMBER_OF_REGISTERS = slice(2, 4)
+    POSITION_FOR_NUMBER_OF_REGISTERS = 2
 
-    bytes_for_mumber_of_registers = payload[BYTERANGE_FOR_NUMBER_OF_REGISTERS]
-    received_number_of_written_registers = _two_bytes_to_num(
-        bytes_for_mumber_of_registers
-    )
+    # Big-endian unsigned short. The payload length is checked above.
+    received_number_of_written_registers = _TWO_BYTES_STRUCTS[
+        (False, False)
+    ].unpack_from(payload, POSITION_FOR_NUMBER_OF_REGISTERS)[0]
 
     if received_number_of_written_registers != number_of_registers:
         raise InvalidResponseError(
@@ -3872,13 +3852,10 @@ def _check_string(
                 )
             )
 
-    if force_ascii and sys.version > "3":
-        try:
-            inputstring.encode("ascii")
-        except UnicodeEncodeError:
-            raise ValueError(
-                "The {0} must be ASCII. Given: {1!r}".format(description, inputstring)
-            )
+    if force_ascii and not inputstring.isascii():
+        raise ValueError(
+            "The {0} must be ASCII. Given: {1!r}".format(description, inputstring)
+        )
 
 
 def _check_int(
@@ -24,7 +24,7 @@ __author__ = "Jonas Berg"
 __license__ = "Apache License, Version 2.0"
 
 import time
-from typing import Dict, Optional, Union
+from typing import Mapping, Optional, Union
 
 DEFAULT_TIMEOUT: float = 0.01
 """The default timeot value in seconds.
@@ -51,15 +51,14 @@ port initialization.
 Might be monkey-patched in the calling test module.
 """
 
-RESPONSES: Dict[bytes, bytes] = {}
-"""A dictionary of respones from the dummy serial port.
+RESPONSES: Mapping[bytes, bytes] = {b"EXAMPLEREQUEST": b"EXAMPLERESPONSE"}
+"""A dictionary (or other mapping) of respones from the dummy serial port.
 
 The key is the message (bytes) sent to the dummy serial port, and the item is the
-response (bytes) from the dummy serial port.
+response (bytes) from the dummy serial port. It is only read, never modified.
 
 Intended to be monkey-patched in the calling test module.
 """
-RESPONSES[b"EXAMPLEREQUEST"] = b"EXAMPLERESPONSE"
 
 
 DEFAULT_RESPONSE = b"NotFoundInResponseDictionary"
@@ -208,7 +207,7 @@ class Serial:
                 + "\n"
             )
 
-        if not type(inputdata) == bytes:
+        if type(inputdata) is not bytes:
             raise TypeError("The input must be type bytes. Given:" + repr(inputdata))
 
         if not self._isOpen:
@@ -55,12 +55,17 @@ Wrong write data in response           write_register        6
 __author__ = "Jonas Berg"
 __license__ = "Apache License, Version 2.0"
 
+import collections
+import math
 import sys
 import time
-from typing import Any, Callable, Dict, Tuple, Type, Union
+import types
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
 import unittest
 
-sys.path.append(".")
+if __name__ == "__main__":
+    # Running as a script: python3 tests/test_minimalmodbus.py
+    sys.path.append(".")
 
 import tests.dummy_serial as dummy_serial  # noqa: E402
 import minimalmodbus  # noqa: E402
@@ -127,13 +132,13 @@ class ExtendedTestCase(unittest.TestCase):
         (if :data:`SHOW_ERROR_MESSAGES_FOR_ASSERTRAISES` is :const:`True`)."""
         if SHOW_ERROR_MESSAGES_FOR_ASSERTRAISES:
             try:
-                unittest.TestCase.assertRaises(
-                    self, _NonexistantError, callableObj, *args, **kwargs
-                )
+                with super().assertRaises(_NonexistantError):
+                    callableObj(*args, **kwargs)
             except Exception:
                 print("\n    " + repr(sys.exc_info()[1]))
         else:
-            unittest.TestCase.assertRaises(self, excClass, callableObj, *args, **kwargs)
+            with super().assertRaises(excClass):
+                callableObj(*args, **kwargs)
 
     def assertAlmostEqualRatio(
         self, first: float, second: float, epsilon: float = 1.000001
@@ -146,9 +151,9 @@ class ExtendedTestCase(unittest.TestCase):
             * first: Input argument for comparison
             * second: Input argument for comparison
             * epsilon: Largest allowed ratio of largest to smallest of the two
-              input arguments
+              input arguments (by magnitude)
         """
-        if first == second:
+        if math.isclose(first, second, rel_tol=epsilon - 1):
             return
 
         if (first < 0 and second >= 0) or (first >= 0 and second < 0):
@@ -158,21 +163,17 @@ class ExtendedTestCase(unittest.TestCase):
                 )
             )
 
-        ratio = max(first, second) / float(min(first, second))
-        if ratio > epsilon:
-            raise AssertionError(
-                "The arguments are not "
-                + "equal: {0!r} and {1!r}. Epsilon is {2!r}.".format(
-                    first, second, epsilon
-                )
-            )
+        raise AssertionError(
+            "The arguments are not "
+            + "equal: {0!r} and {1!r}. Epsilon is {2!r}.".format(first, second, epsilon)
+        )
 
 
 ##############################
 # Constants for type testing #
 ##############################
 
-_NOT_INTERGERS_OR_NONE = [
+_NOT_INTERGERS_OR_NONE: Tuple[Any, ...] = (
     0.0,
     1.0,
     "1",
@@ -182,10 +183,10 @@ _NOT_INTERGERS_OR_NONE = [
     [1],
     ["\x00\x2d\x00\x58"],
     ["A", "B", "C"],
-]
-_NOT_INTERGERS = _NOT_INTERGERS_OR_NONE + [None]
+)
+_NOT_INTERGERS = _NOT_INTERGERS_OR_NONE + (None,)
 
-_NOT_NUMERICALS_OR_NONE = [
+_NOT_NUMERICALS_OR_NONE: Tuple[Any, ...] = (
     "1",
     b"1",
     ["1"],
@@ -193,10 +194,10 @@ _NOT_NUMERICALS_OR_NONE = [
     [1],
     ["\x00\x2d\x00\x58"],
     ["A", "B", "C"],
-]
-_NOT_NUMERICALS = _NOT_NUMERICALS_OR_NONE + [None]
+)
+_NOT_NUMERICALS = _NOT_NUMERICALS_OR_NONE + (None,)
 
-_NOT_STRINGS_OR_NONE = [
+_NOT_STRINGS_OR_NONE: Tuple[Any, ...] = (
     1,
     0.0,
     1.0,
@@ -208,10 +209,10 @@ _NOT_STRINGS_OR_NONE = [
     ["A", "B", "C"],
     True,
     False,
-]
-_NOT_STRINGS = _NOT_STRINGS_OR_NONE + [None]
+)
+_NOT_STRINGS = _NOT_STRINGS_OR_NONE + (None,)
 
-_NOT_BYTES_OR_NONE = [
+_NOT_BYTES_OR_NONE: Tuple[Any, ...] = (
     1,
     0.0,
     1.0,
@@ -223,10 +224,10 @@ _NOT_BYTES_OR_NONE = [
     ["A", "B", "C"],
     True,
     False,
-]
-_NOT_BYTES = _NOT_BYTES_OR_NONE + [None]
+)
+_NOT_BYTES = _NOT_BYTES_OR_NONE + (None,)
 
-_NOT_BOOLEANS = [
+_NOT_BOOLEANS: Tuple[Any, ...] = (
     "True",
     "False",
     b"1",
@@ -244,9 +245,9 @@ _NOT_BOOLEANS = [
     [False],
     [1],
     [1.0],
-]
+)
 
-_NOT_INTLISTS = [
+_NOT_INTLISTS: Tuple[Any, ...] = (
     0,
     1,
     2,
@@ -264,7 +265,7 @@ _NOT_INTLISTS = [
     ["A", "B", "C"],
     [1.0],
     [1.0, 2.0],
-]
+)
 
 
 ####################
@@ -273,53 +274,38 @@ _NOT_INTLISTS = [
 
 
 class TestCreatePayload(ExtendedTestCase):
-    def testKnownValues(self) -> None:
+    known_values: List[Tuple[Tuple[Any, ...], Any]] = [
         # read_bit(61, functioncode=2)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                2, 61, None, 0, 0, 1, False, BYTEORDER_BIG, _Payloadformat.BIT
-            ),
+        (
+            (2, 61, None, 0, 0, 1, False, BYTEORDER_BIG, _Payloadformat.BIT),
             b"\x00\x3D\x00\x01",
-        )
-
+        ),
         # read_bit(62, functioncode=1)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                1, 62, None, 0, 0, 1, False, BYTEORDER_BIG, _Payloadformat.BIT
-            ),
+        (
+            (1, 62, None, 0, 0, 1, False, BYTEORDER_BIG, _Payloadformat.BIT),
             b"\x00\x3E\x00\x01",
-        )
-
+        ),
         # write_bit(71, 1, functioncode=5)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                5, 71, 1, 0, 0, 1, False, BYTEORDER_BIG, _Payloadformat.BIT
-            ),
+        (
+            (5, 71, 1, 0, 0, 1, False, BYTEORDER_BIG, _Payloadformat.BIT),
             b"\x00\x47\xFF\x00",
-        )
-
+        ),
         # read_bits(196, 22, functioncode=2)
         # Example from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                2, 196, None, 0, 0, 22, False, BYTEORDER_BIG, _Payloadformat.BITS
-            ),
+        (
+            (2, 196, None, 0, 0, 22, False, BYTEORDER_BIG, _Payloadformat.BITS),
             b"\x00\xC4\x00\x16",
-        )
-
+        ),
         # read_bits(19, 19, functioncode=1)
         # Example from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                1, 19, None, 0, 0, 19, False, BYTEORDER_BIG, _Payloadformat.BITS
-            ),
+        (
+            (1, 19, None, 0, 0, 19, False, BYTEORDER_BIG, _Payloadformat.BITS),
             b"\x00\x13\x00\x13",
-        )
-
+        ),
         # write_bits(19, [1, 0, 1, 1, 0, 0, 1, 1, 1, 0])
         # Example from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
-        self.assertEqual(
-            minimalmodbus._create_payload(
+        (
+            (
                 15,
                 19,
                 [1, 0, 1, 1, 0, 0, 1, 1, 1, 0],
@@ -331,250 +317,155 @@ class TestCreatePayload(ExtendedTestCase):
                 _Payloadformat.BITS,
             ),
             b"\x00\x13\x00\x0A\x02\xCD\x01",
-        )
-
+        ),
         # read_register(289, 0, functioncode=3)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 289, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER
-            ),
+        (
+            (3, 289, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER),
             b"\x01\x21\x00\x01",
-        )
-
+        ),
         # read_register(14, 0, functioncode=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                4, 14, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER
-            ),
+        (
+            (4, 14, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER),
             b"\x00\x0E\x00\x01",
-        )
-
+        ),
         # write_register(35, 20, functioncode = 16)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 35, 20, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER
-            ),
+        (
+            (16, 35, 20, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER),
             b"\x00\x23\x00\x01\x02\x00\x14",
-        )
-
+        ),
         # write_register(45, 88, functioncode = 6)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                6, 45, 88, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER
-            ),
+        (
+            (6, 45, 88, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTER),
             b"\x00\x2D\x00\x58",
-        )
-
+        ),
         # write_register(101, -5, signed=True)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 101, -5, 0, 1, 0, True, BYTEORDER_BIG, _Payloadformat.REGISTER
-            ),
+        (
+            (16, 101, -5, 0, 1, 0, True, BYTEORDER_BIG, _Payloadformat.REGISTER),
             b"\x00\x65\x00\x01\x02\xFF\xFB",
-        )
-
+        ),
         # write_register(101, -5, 1, signed=True)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 101, -5, 1, 1, 0, True, BYTEORDER_BIG, _Payloadformat.REGISTER
-            ),
+        (
+            (16, 101, -5, 1, 1, 0, True, BYTEORDER_BIG, _Payloadformat.REGISTER),
             b"\x00\x65\x00\x01\x02\xFF\xCE",
-        )
-
+        ),
         # read_long(102)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 102, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (3, 102, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x00\x66\x00\x02",
-        )
-
+        ),
         # read_long(102, functioncode=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                4, 102, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (4, 102, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x00\x66\x00\x02",
-        )
-
+        ),
         # read_long(256)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 256, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (3, 256, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x01\x00\x00\x02",
-        )
+        ),
         # read_long(256, number_of_registers=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 256, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (3, 256, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x01\x00\x00\x04",
-        )
-
+        ),
         # write_long(102, 5)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 102, 5, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (16, 102, 5, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x00\x66\x00\x02\x04\x00\x00\x00\x05",
-        )
-
+        ),
         # write_long(102, 5,  signed=True)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 102, 5, 0, 2, 0, True, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (16, 102, 5, 0, 2, 0, True, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x00\x66\x00\x02\x04\x00\x00\x00\x05",
-        )
-
+        ),
         # write_long(102, -5, signed=True)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 102, -5, 0, 2, 0, True, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (16, 102, -5, 0, 2, 0, True, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x00\x66\x00\x02\x04\xFF\xFF\xFF\xFB",
-        )
-
+        ),
         # write_long(102, -5, signed=True, number_of_registers=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 102, -5, 0, 4, 0, True, BYTEORDER_BIG, _Payloadformat.LONG
-            ),
+        (
+            (16, 102, -5, 0, 4, 0, True, BYTEORDER_BIG, _Payloadformat.LONG),
             b"\x00\x66\x00\x04\x08\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFB",
-        )
-
+        ),
         # read_float(103, functioncode=3, number_of_registers=2)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 103, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT
-            ),
+        (
+            (3, 103, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT),
             b"\x00\x67\x00\x02",
-        )
-
+        ),
         # read_float(103, functioncode=3, number_of_registers=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 103, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT
-            ),
+        (
+            (3, 103, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT),
             b"\x00\x67\x00\x04",
-        )
-
+        ),
         # read_float(103, functioncode=4, number_of_registers=2)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                4, 103, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT
-            ),
+        (
+            (4, 103, None, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT),
             b"\x00\x67\x00\x02",
-        )
-
+        ),
         # write_float(103, 1.1, number_of_registers=2)   OK compare to recorded data
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 103, 1.1, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT
-            ),
+        (
+            (16, 103, 1.1, 0, 2, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT),
             b"\x00\x67\x00\x02\x04\x3F\x8C\xCC\xCD",
-        )
-
+        ),
         # write_float(103, 1.1, number_of_registers=4)   OK compare to recorded data
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 103, 1.1, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT
-            ),
+        (
+            (16, 103, 1.1, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.FLOAT),
             b"\x00\x67\x00\x04\x08\x3F\xF1\x99\x99\x99\x99\x99\x9A",
-        )
-
+        ),
         # read_string(104, 1)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 104, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.STRING
-            ),
+        (
+            (3, 104, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.STRING),
             b"\x00\x68\x00\x01",
-        )
-
+        ),
         # read_string(104, 4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 104, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING
-            ),
+        (
+            (3, 104, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING),
             b"\x00\x68\x00\x04",
-        )
-
+        ),
         # read_string(104, 4, functioncode=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                4, 104, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING
-            ),
+        (
+            (4, 104, None, 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING),
             b"\x00\x68\x00\x04",
-        )
-
+        ),
         # write_string(104, 'A', 1)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 104, "A", 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.STRING
-            ),
+        (
+            (16, 104, "A", 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.STRING),
             b"\x00\x68\x00\x01\x02A ",
-        )
-
+        ),
         # write_string(104, 'A', 4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 104, "A", 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING
-            ),
+        (
+            (16, 104, "A", 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING),
             b"\x00\x68\x00\x04\x08A       ",
-        )
-
+        ),
         # write_string(104, 'ABCDEFGH', 4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16,
-                104,
-                "ABCDEFGH",
-                0,
-                4,
-                0,
-                False,
-                BYTEORDER_BIG,
-                _Payloadformat.STRING,
-            ),
+        (
+            (16, 104, "ABCDEFGH", 0, 4, 0, False, BYTEORDER_BIG, _Payloadformat.STRING),
             b"\x00\x68\x00\x04\x08ABCDEFGH",
-        )
-
+        ),
         # read_registers(105, 1)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 105, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS
-            ),
+        (
+            (3, 105, None, 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS),
             b"\x00\x69\x00\x01",
-        )
-
+        ),
         # read_registers(105, 3)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                3, 105, None, 0, 3, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS
-            ),
+        (
+            (3, 105, None, 0, 3, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS),
             b"\x00\x69\x00\x03",
-        )
-
+        ),
         # read_registers(105, 7, functioncode=4)
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                4, 105, None, 0, 7, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS
-            ),
+        (
+            (4, 105, None, 0, 7, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS),
             b"\x00\x69\x00\x07",
-        )
-
+        ),
         # write_registers(105, [2])
-        self.assertEqual(
-            minimalmodbus._create_payload(
-                16, 105, [2], 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS
-            ),
+        (
+            (16, 105, [2], 0, 1, 0, False, BYTEORDER_BIG, _Payloadformat.REGISTERS),
             b"\x00\x69\x00\x01\x02\x00\x02",
-        )
-
+        ),
         # write_registers(105, [2, 4, 8])
-        self.assertEqual(
-            minimalmodbus._create_payload(
+        (
+            (
                 16,
                 105,
                 [2, 4, 8],
@@ -586,13 +477,21 @@ class TestCreatePayload(ExtendedTestCase):
                 _Payloadformat.REGISTERS,
             ),
             b"\x00\x69\x00\x03\x06\x00\x02\x00\x04\x00\x08",
-        )
+        ),
+    ]
+
+    def testKnownValues(self) -> None:
+        create_payload = minimalmodbus._create_payload
+        for arguments, known_payload in self.known_values:
+            with self.subTest(arguments=arguments):
+                self.assertEqual(create_payload(*arguments), known_payload)
 
     def testWrongValues(self) -> None:
+        create_payload = minimalmodbus._create_payload
         # NOTE: Most of the error checking is done in other methods
         self.assertRaises(
             ValueError,
-            minimalmodbus._create_payload,
+            create_payload,
             25,  # Wrong on purpose
             104,
             "A",
@@ -606,7 +505,7 @@ class TestCreatePayload(ExtendedTestCase):
 
         self.assertRaises(
             ValueError,
-            minimalmodbus._create_payload,
+            create_payload,
             15,
             104,
             "ABC",  # Wrong on purpose
@@ -620,7 +519,7 @@ class TestCreatePayload(ExtendedTestCase):
 
         self.assertRaises(
             ValueError,
-            minimalmodbus._create_payload,
+            create_payload,
             16,
             104,
             [1, 0, 1],  # Wrong on purpose
@@ -634,10 +533,10 @@ class TestCreatePayload(ExtendedTestCase):
 
 
 class TestParsePayload(ExtendedTestCase):
-    def testKnownValues(self) -> None:
+    known_values: List[Tuple[Tuple[Any, ...], Any]] = [
         # read_bit(61, functioncode=2)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x01\x01",
                 2,
                 61,
@@ -650,11 +549,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BIT,
             ),
             1,
-        )
-
+        ),
         # read_bit(62, functioncode=1)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x01\x00",
                 1,
                 62,
@@ -667,11 +565,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BIT,
             ),
             0,
-        )
-
+        ),
         # write_bit(71, 1, functioncode=5)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00\x47\xff\x00",
                 5,
                 71,
@@ -684,11 +581,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BIT,
             ),
             None,
-        )
-
+        ),
         # write_bit(72, 1, functioncode=15)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00\x48\x00\x01",
                 15,
                 72,
@@ -701,12 +597,11 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BIT,
             ),
             None,
-        )
-
+        ),
         # read_bits(196, 22, functioncode=2)
         # Example from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x03\xAC\xDB\x35",
                 2,
                 196,
@@ -719,12 +614,11 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BITS,
             ),
             [0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1],
-        )
-
+        ),
         # read_bits(19, 19, functioncode=1)
         # Example from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x03\xCD\x6B\x05",
                 1,
                 19,
@@ -737,12 +631,11 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BITS,
             ),
             [1, 0, 1, 1, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1],
-        )
-
+        ),
         # write_bits(19, [1, 0, 1, 1, 0, 0, 1, 1, 1, 0])
         # Example from MODBUS APPLICATION PROTOCOL SPECIFICATION V1.1b
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00\x13\x00\x0A",
                 15,
                 19,
@@ -755,11 +648,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.BITS,
             ),
             None,
-        )
-
+        ),
         # read_register(289, 0, functioncode=3)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x02\x03\x02",
                 3,
                 289,
@@ -772,11 +664,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTER,
             ),
             770,
-        )
-
+        ),
         # read_register(14, 0, functioncode=4)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x02\x03\x70",
                 4,
                 14,
@@ -789,11 +680,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTER,
             ),
             880,
-        )
-
+        ),
         # write_register(35, 20, functioncode = 16)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00#\x00\x01",
                 16,
                 35,
@@ -806,11 +696,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTER,
             ),
             None,
-        )
-
+        ),
         # write_register(45, 88, functioncode = 6)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00\x2d\x00\x58",
                 6,
                 45,
@@ -823,11 +712,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTER,
             ),
             None,
-        )
-
+        ),
         # write_register(101, -5, signed=True)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00e\x00\x01",
                 16,
                 101,
@@ -840,11 +728,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTER,
             ),
             None,
-        )
-
+        ),
         # read_long(102)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x04\xff\xff\xff\xff",
                 3,
                 102,
@@ -857,11 +744,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.LONG,
             ),
             4294967295,
-        )
-
+        ),
         # read_long(102, signed=True)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x04\xff\xff\xff\xff",
                 3,
                 102,
@@ -874,11 +760,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.LONG,
             ),
             -1,
-        )
-
+        ),
         # write_long(102, 5)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00f\x00\x02",
                 16,
                 102,
@@ -891,11 +776,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.LONG,
             ),
             None,
-        )
-
+        ),
         # write_long(102, -5, signed=True)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00f\x00\x02",
                 16,
                 102,
@@ -908,68 +792,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.LONG,
             ),
             None,
-        )
-
-        # read_float(103, functioncode=3, number_of_registers=2)
-        parsed_value = minimalmodbus._parse_payload(
-            b"\x04\x3f\x80\x00\x00",
-            3,
-            103,
-            None,
-            0,
-            2,
-            0,
-            False,
-            BYTEORDER_BIG,
-            _Payloadformat.FLOAT,
-        )
-        assert isinstance(parsed_value, float)
-        self.assertAlmostEqual(
-            parsed_value,
-            1.0,
-        )
-
-        # read_float(103, functioncode=3, number_of_registers=4)
-        parsed_value = minimalmodbus._parse_payload(
-            b"\x08\xc0\x00\x00\x00\x00\x00\x00\x00",
-            3,
-            103,
-            None,
-            0,
-            4,
-            0,
-            False,
-            BYTEORDER_BIG,
-            _Payloadformat.FLOAT,
-        )
-        assert isinstance(parsed_value, float)
-        self.assertAlmostEqual(
-            parsed_value,
-            -2.0,
-        )
-
-        # read_float(103, functioncode=4, number_of_registers=2)
-        parsed_value = minimalmodbus._parse_payload(
-            b"\x04\x72\x38\x47\x25",
-            4,
-            103,
-            None,
-            0,
-            2,
-            0,
-            False,
-            BYTEORDER_BIG,
-            _Payloadformat.FLOAT,
-        )
-        assert isinstance(parsed_value, float)
-        self.assertAlmostEqualRatio(
-            parsed_value,
-            3.65e30,
-        )
-
+        ),
         # write_float(103, 1.1, number_of_registers=2)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00g\x00\x02",
                 16,
                 103,
@@ -982,11 +808,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.FLOAT,
             ),
             None,
-        )
-
+        ),
         # write_float(103, 1.1, number_of_registers=4)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00g\x00\x04",
                 16,
                 103,
@@ -999,11 +824,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.FLOAT,
             ),
             None,
-        )
-
+        ),
         # read_string(104, 1)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x02AB",
                 3,
                 104,
@@ -1016,11 +840,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.STRING,
             ),
             "AB",
-        )
-
+        ),
         # read_string(104, 4)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x08ABCDEFGH",
                 3,
                 104,
@@ -1033,11 +856,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.STRING,
             ),
             "ABCDEFGH",
-        )
-
+        ),
         # write_string(104, 'A', 1)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00h\x00\x01",
                 16,
                 104,
@@ -1050,11 +872,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.STRING,
             ),
             None,
-        )
-
+        ),
         # write_string(104, 'A', 4)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00h\x00\x04",
                 16,
                 104,
@@ -1067,11 +888,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.STRING,
             ),
             None,
-        )
-
+        ),
         # write_string(104, 'ABCDEFGH', 4)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00h\x00\x04",
                 16,
                 104,
@@ -1084,11 +904,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.STRING,
             ),
             None,
-        )
-
+        ),
         # read_registers(105, 1)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x02\x00\x10",
                 3,
                 105,
@@ -1101,11 +920,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTERS,
             ),
             [16],
-        )
-
+        ),
         # read_registers(105, 3)
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x06\x00\x10\x00\x20\x00\x40",
                 3,
                 105,
@@ -1118,11 +936,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTERS,
             ),
             [16, 32, 64],
-        )
-
+        ),
         # write_registers(105, [2])
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00i\x00\x01",
                 16,
                 105,
@@ -1135,11 +952,10 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTERS,
             ),
             None,
-        )
-
+        ),
         # write_registers(105, [2, 4, 8])
-        self.assertEqual(
-            minimalmodbus._parse_payload(
+        (
+            (
                 b"\x00i\x00\x03",
                 16,
                 105,
@@ -1152,13 +968,80 @@ class TestParsePayload(ExtendedTestCase):
                 _Payloadformat.REGISTERS,
             ),
             None,
+        ),
+    ]
+
+    def testKnownValues(self) -> None:
+        parse_payload = minimalmodbus._parse_payload
+        for arguments, known_result in self.known_values:
+            with self.subTest(arguments=arguments):
+                self.assertEqual(parse_payload(*arguments), known_result)
+
+    def testKnownFloatValues(self) -> None:
+        parse_payload = minimalmodbus._parse_payload
+        # read_float(103, functioncode=3, number_of_registers=2)
+        parsed_value = parse_payload(
+            b"\x04\x3f\x80\x00\x00",
+            3,
+            103,
+            None,
+            0,
+            2,
+            0,
+            False,
+            BYTEORDER_BIG,
+            _Payloadformat.FLOAT,
+        )
+        assert isinstance(parsed_value, float)
+        self.assertAlmostEqual(
+            parsed_value,
+            1.0,
+        )
+
+        # read_float(103, functioncode=3, number_of_registers=4)
+        parsed_value = parse_payload(
+            b"\x08\xc0\x00\x00\x00\x00\x00\x00\x00",
+            3,
+            103,
+            None,
+            0,
+            4,
+            0,
+            False,
+            BYTEORDER_BIG,
+            _Payloadformat.FLOAT,
+        )
+        assert isinstance(parsed_value, float)
+        self.assertAlmostEqual(
+            parsed_value,
+            -2.0,
+        )
+
+        # read_float(103, functioncode=4, number_of_registers=2)
+        parsed_value = parse_payload(
+            b"\x04\x72\x38\x47\x25",
+            4,
+            103,
+            None,
+            0,
+            2,
+            0,
+            False,
+            BYTEORDER_BIG,
+            _Payloadformat.FLOAT,
+        )
+        assert isinstance(parsed_value, float)
+        self.assertAlmostEqualRatio(
+            parsed_value,
+            3.65e30,
         )
 
     def testInvalidPayloads(self) -> None:
+        parse_payload = minimalmodbus._parse_payload
         # read_bit(63, functioncode=2)  # Slave gives wrong byte count
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x02\x01",
             2,
             63,
@@ -1174,7 +1057,7 @@ class TestParsePayload(ExtendedTestCase):
         # write_bit(73, 1, functioncode=15)  # Slave gives wrong number of registers
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x49\x00\x02",
             15,
             73,
@@ -1190,7 +1073,7 @@ class TestParsePayload(ExtendedTestCase):
         # write_bit(74, 1, functioncode=5)  # Slave gives wrong write data
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x47\x00\x00",
             5,
             74,
@@ -1206,7 +1089,7 @@ class TestParsePayload(ExtendedTestCase):
         # write_bit(73, 1, functioncode=15)  # Slave gives wrong number of registers
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x49\x00\x02",
             15,
             73,
@@ -1222,7 +1105,7 @@ class TestParsePayload(ExtendedTestCase):
         # write_bit(74, 1, functioncode=5)  # Slave gives wrong write data (address)
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x47\x00\x00",
             5,
             74,
@@ -1238,7 +1121,7 @@ class TestParsePayload(ExtendedTestCase):
         # read_bits(196, 22, functioncode=2)  # Wrong number of bits
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x03\xAC\xDB\x35",
             2,
             196,
@@ -1254,7 +1137,7 @@ class TestParsePayload(ExtendedTestCase):
         # read_register(202, 0, functioncode=3)  # Slave gives too long response
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x02\x00\x00\x09",
             3,
             202,
@@ -1270,7 +1153,7 @@ class TestParsePayload(ExtendedTestCase):
         # read_register(203, 0, functioncode=3)  # Slave gives too short response
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x02\x09",
             3,
             203,
@@ -1287,7 +1170,7 @@ class TestParsePayload(ExtendedTestCase):
         # Slave gives wrong number of registers
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x34\x00\x02",
             16,
             52,
@@ -1304,7 +1187,7 @@ class TestParsePayload(ExtendedTestCase):
         # Slave gives wrong register address
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x36\x00\x01",
             16,
             53,
@@ -1320,7 +1203,7 @@ class TestParsePayload(ExtendedTestCase):
         # write_register(55, 99, functioncode = 6)  # Slave gives wrong write data
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x00\x36\x00\x01",
             6,
             55,
@@ -1336,7 +1219,7 @@ class TestParsePayload(ExtendedTestCase):
         # read_registers(105, 3)  # wrong number of registers
         self.assertRaises(
             InvalidResponseError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x06\x00\x10\x00\x20\x00\x40",
             3,
             105,
@@ -1352,7 +1235,7 @@ class TestParsePayload(ExtendedTestCase):
         # wrong functioncode
         self.assertRaises(
             ValueError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"ABC",
             10,
             105,
@@ -1368,7 +1251,7 @@ class TestParsePayload(ExtendedTestCase):
         # wrong functioncode and payload combination
         self.assertRaises(
             ValueError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x01\x01",
             1,
             105,
@@ -1382,7 +1265,7 @@ class TestParsePayload(ExtendedTestCase):
         )
         self.assertRaises(
             ValueError,
-            minimalmodbus._parse_payload,
+            parse_payload,
             b"\x02\x00\x01",
             3,
             105,
@@ -1396,6 +1279,41 @@ class TestParsePayload(ExtendedTestCase):
         )
 
 
+class TestSanityCreateParsePayload(ExtendedTestCase):
+    known_values = TestCreatePayload.known_values
+
+    def testWriteConfirmations(self) -> None:
+        # The slave confirms a write by echoing (the start of) the request payload
+        create_payload = minimalmodbus._create_payload
+        parse_payload = minimalmodbus._parse_payload
+        for arguments, _ in self.known_values:
+            functioncode = arguments[0]
+            payload = create_payload(*arguments)
+            if functioncode in [5, 6]:
+                self.assertIsNone(parse_payload(payload, *arguments))
+            elif functioncode in [15, 16]:
+                self.assertIsNone(parse_payload(payload[:4], *arguments))
+
+    def testRange(self) -> None:
+        create_payload = minimalmodbus._create_payload
+        parse_payload = minimalmodbus._parse_payload
+        for registeraddress in range(0, 0x10000, 0x1111):
+            for value in range(0, 0x10000, 0x0101):
+                arguments = (
+                    6,
+                    registeraddress,
+                    value,
+                    0,
+                    1,
+                    0,
+                    False,
+                    BYTEORDER_BIG,
+                    _Payloadformat.REGISTER,
+                )
+                payload = create_payload(*arguments)
+                self.assertIsNone(parse_payload(payload, *arguments))
+
+
 class TestEmbedPayload(ExtendedTestCase):
     known_values = [
         (2, 2, "rtu", b"123", b"\x02\x02123X\xc2"),
@@ -1462,29 +1380,32 @@ class TestEmbedPayload(ExtendedTestCase):
 
     def testWrongInputType(self) -> None:
         for value in _NOT_INTERGERS:
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, value, "rtu", 16, b"ABC"
-            )
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, value, "ascii", 16, b"ABC"
-            )
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, 1, "rtu", value, b"ABC"
-            )
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, 1, "ascii", value, b"ABC"
-            )
+            with self.subTest(value=value):
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, value, "rtu", 16, b"ABC"
+                )
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, value, "ascii", 16, b"ABC"
+                )
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, 1, "rtu", value, b"ABC"
+                )
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, 1, "ascii", value, b"ABC"
+                )
         for value in _NOT_STRINGS:
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, 1, value, 16, b"ABC"
-            )
+            with self.subTest(value=value):
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, 1, value, 16, b"ABC"
+                )
         for value in _NOT_BYTES:
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, 1, "rtu", 16, value
-            )
-            self.assertRaises(
-                TypeError, minimalmodbus._embed_payload, 1, "ascii", 16, value
-            )
+            with self.subTest(value=value):
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, 1, "rtu", 16, value
+                )
+                self.assertRaises(
+                    TypeError, minimalmodbus._embed_payload, 1, "ascii", 16, value
+                )
 
 
 class TestExtractPayload(ExtendedTestCase):
@@ -1653,54 +1574,57 @@ class TestExtractPayload(ExtendedTestCase):
 
     def testWrongInputType(self) -> None:
         for value in _NOT_INTERGERS:
-            self.assertRaises(
-                TypeError,
-                minimalmodbus._extract_payload,
-                b"\x02\x02123X\xc2",
-                value,
-                "rtu",
-                2,
-            )  # Wrong slaveaddress type
-            self.assertRaises(
-                TypeError,
-                minimalmodbus._extract_payload,
-                b"\x02\x02123X\xc2",
-                value,
-                "ascii",
-                2,
-            )
-            self.assertRaises(
-                TypeError,
-                minimalmodbus._extract_payload,
-                b"\x02\x02123X\xc2",
-                2,
-                "rtu",
-                value,
-            )  # Wrong functioncode type
-            self.assertRaises(
-                TypeError,
-                minimalmodbus._extract_payload,
-                b"\x02\x02123X\xc2",
-                2,
-                "ascii",
-                value,
-            )
+            with self.subTest(value=value):
+                self.assertRaises(
+                    TypeError,
+                    minimalmodbus._extract_payload,
+                    b"\x02\x02123X\xc2",
+                    value,
+                    "rtu",
+                    2,
+                )  # Wrong slaveaddress type
+                self.assertRaises(
+                    TypeError,
+                    minimalmodbus._extract_payload,
+                    b"\x02\x02123X\xc2",
+                    value,
+                    "ascii",
+                    2,
+                )
+                self.assertRaises(
+                    TypeError,
+                    minimalmodbus._extract_payload,
+                    b"\x02\x02123X\xc2",
+                    2,
+                    "rtu",
+                    value,
+                )  # Wrong functioncode type
+                self.assertRaises(
+                    TypeError,
+                    minimalmodbus._extract_payload,
+                    b"\x02\x02123X\xc2",
+                    2,
+                    "ascii",
+                    value,
+                )
         for value in _NOT_BYTES:
-            self.assertRaises(
-                TypeError, minimalmodbus._extract_payload, value, 2, "rtu", 2
-            )  # Wrong message
-            self.assertRaises(
-                TypeError, minimalmodbus._extract_payload, value, 2, "ascii", 2
-            )
+            with self.subTest(value=value):
+                self.assertRaises(
+                    TypeError, minimalmodbus._extract_payload, value, 2, "rtu", 2
+                )  # Wrong message
+                self.assertRaises(
+                    TypeError, minimalmodbus._extract_payload, value, 2, "ascii", 2
+                )
         for value in _NOT_STRINGS:
-            self.assertRaises(
-                TypeError,
-                minimalmodbus._extract_payload,
-                b"\x02\x02123X\xc2",
-                2,
-                value,
-                2,
-            )  # Wrong mode
+            with self.subTest(value=value):
+                self.assertRaises(
+                    TypeError,
+                    minimalmodbus._extract_payload,
+                    b"\x02\x02123X\xc2",
+                    2,
+                    value,
+                    2,
+                )  # Wrong mode
 
 
 class TestSanityEmbedExtractPayload(ExtendedTestCase):
@@ -2119,10 +2043,10 @@ class TestSanityTwoBytes(ExtendedTestCase):
                 )
                 self.assertEqual(resultvalue, value)
 
+        two_bytes_to_num = minimalmodbus._two_bytes_to_num
+        num_to_two_bytes = minimalmodbus._num_to_two_bytes
         for value in range(0x10000):
-            resultvalue = minimalmodbus._two_bytes_to_num(
-                minimalmodbus._num_to_two_bytes(value)
-            )
+            resultvalue = two_bytes_to_num(num_to_two_bytes(value))
             self.assertEqual(resultvalue, value)
 
 
@@ -2859,12 +2783,12 @@ class TestSanityHexencodeHexdecode(ExtendedTestCase):
     def testKnownValuesLoop(self) -> None:
         """Loop through all bytes objects of length two."""
         RANGE_VALUE = 256
+        hexdecode = minimalmodbus._hexdecode
+        hexencode = minimalmodbus._hexencode
         for i in range(RANGE_VALUE):
             for j in range(RANGE_VALUE):
                 inputbytes = bytes([i, j])
-                resultbytes = minimalmodbus._hexdecode(
-                    minimalmodbus._hexencode(inputbytes)
-                )
+                resultbytes = hexdecode(hexencode(inputbytes))
                 self.assertEqual(resultbytes, inputbytes)
 
 
@@ -2933,6 +2857,7 @@ class TestFromTwosComplement(ExtendedTestCase):
         self.assertRaises(ValueError, minimalmodbus._from_twos_complement, 65536, 16)
         self.assertRaises(ValueError, minimalmodbus._from_twos_complement, 1000000, 16)
         self.assertRaises(ValueError, minimalmodbus._from_twos_complement, -1, 16)
+        self.assertRaises(ValueError, minimalmodbus._from_twos_complement, 0, 0)
         self.assertRaises(ValueError, minimalmodbus._from_twos_complement, 1, 0)
         self.assertRaises(ValueError, minimalmodbus._from_twos_complement, 1, -1)
         self.assertRaises(ValueError, minimalmodbus._from_twos_complement, 1, -2)
@@ -2948,11 +2873,11 @@ class TestSanityTwosComplement(ExtendedTestCase):
     known_values = [1, 2, 4, 8, 12, 16]
 
     def testSanity(self) -> None:
+        twos_complement = minimalmodbus._twos_complement
+        from_twos_complement = minimalmodbus._from_twos_complement
         for bits in self.known_values:
             for x in range(2**bits):
-                resultvalue = minimalmodbus._twos_complement(
-                    minimalmodbus._from_twos_complement(x, bits), bits
-                )
+                resultvalue = twos_complement(from_twos_complement(x, bits), bits)
                 self.assertEqual(resultvalue, x)
 
 
@@ -3043,10 +2968,10 @@ class TestCalculateCrc(ExtendedTestCase):
                 len(all_byte_variants)
             )
         )
-        start_time = time.time()
+        start_time = time.perf_counter()
         for byte_variants in all_byte_variants:
             minimalmodbus._calculate_crc(byte_variants)
-        calculation_time = time.time() - start_time
+        calculation_time = time.perf_counter() - start_time
         print(
             "CRC calculation time: "
             + "{} calculations took {:.3f} s ({} s per calculation)\n\n".format(
@@ -3170,72 +3095,34 @@ class TestCheckRegisteraddress(ExtendedTestCase):
 
 
 class TestCheckResponseSlaveErrorCode(ExtendedTestCase):
+    known_errors: List[Tuple[bytes, Type[Exception]]] = [
+        (b"\x01\x81\x01", IllegalRequestError),
+        (b"\x01\x81\x02", IllegalRequestError),
+        (b"\x01\x81\x03", IllegalRequestError),
+        (b"\x01\x81\x04", SlaveReportedException),
+        (b"\x01\x81\x06", SlaveDeviceBusyError),
+        (b"\x01\x81\x07", NegativeAcknowledgeError),
+        (b"\x01\x81\x08", SlaveReportedException),
+        (b"\x01\x81\x09", SlaveReportedException),
+        (b"\x01\x81\x0A", SlaveReportedException),
+        (b"\x01\x81\x0B", SlaveReportedException),
+        (b"\x01\x81\x0C", SlaveReportedException),
+        (b"\x01\x81\xFF", SlaveReportedException),
+    ]
+
     def testResponsesWithoutErrors(self) -> None:
         minimalmodbus._check_response_slaveerrorcode(b"\x01\x01\x01\x00Q\x88")
         minimalmodbus._check_response_slaveerrorcode(b"\x01\x01\x05")
         minimalmodbus._check_response_slaveerrorcode(b"\x01\x81\x05")
 
     def testResponsesWithErrors(self) -> None:
-        self.assertRaises(
-            IllegalRequestError,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x01",
-        )
-        self.assertRaises(
-            IllegalRequestError,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x02",
-        )
-        self.assertRaises(
-            IllegalRequestError,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x03",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x04",
-        )
-        self.assertRaises(
-            SlaveDeviceBusyError,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x06",
-        )
-        self.assertRaises(
-            NegativeAcknowledgeError,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x07",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x08",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x09",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x0A",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x0B",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\x0C",
-        )
-        self.assertRaises(
-            SlaveReportedException,
-            minimalmodbus._check_response_slaveerrorcode,
-            b"\x01\x81\xFF",
-        )
+        for response, exception_class in self.known_errors:
+            with self.subTest(response=response):
+                self.assertRaises(
+                    exception_class,
+                    minimalmodbus._check_response_slaveerrorcode,
+                    response,
+                )
 
     def testTooShortResponses(self) -> None:
         minimalmodbus._check_response_slaveerrorcode(b"")
@@ -3984,9 +3871,10 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.read_bit, 62, 128)
 
     def testReadBitWrongType(self) -> None:
+        read_bit = self.instrument.read_bit
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.read_bit, value)
-            self.assertRaises(TypeError, self.instrument.read_bit, 62, value)
+            self.assertRaises(TypeError, read_bit, value)
+            self.assertRaises(TypeError, read_bit, 62, value)
 
     def testReadBitWithWrongByteCountResponse(self) -> None:
         # Functioncode 2. Slave gives wrong byte count.
@@ -4024,10 +3912,11 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.write_bit, 71, 1, 128)
 
     def testWriteBitWrongType(self) -> None:
+        write_bit = self.instrument.write_bit
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.write_bit, value, 1)
-            self.assertRaises(TypeError, self.instrument.write_bit, 71, value)
-            self.assertRaises(TypeError, self.instrument.write_bit, 71, 1, value)
+            self.assertRaises(TypeError, write_bit, value, 1)
+            self.assertRaises(TypeError, write_bit, 71, value)
+            self.assertRaises(TypeError, write_bit, 71, 1, value)
 
     def testWriteBitWithWrongRegisternumbersResponse(self) -> None:
         # Slave gives wrong number of registers
@@ -4104,10 +3993,11 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.read_register, 289, 0, -4)
 
     def testReadRegisterWrongType(self) -> None:
+        read_register = self.instrument.read_register
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.read_register, value, 0, 3)
-            self.assertRaises(TypeError, self.instrument.read_register, 289, value)
-            self.assertRaises(TypeError, self.instrument.read_register, 289, 0, value)
+            self.assertRaises(TypeError, read_register, value, 0, 3)
+            self.assertRaises(TypeError, read_register, 289, value)
+            self.assertRaises(TypeError, read_register, 289, 0, value)
 
     # Write register #
 
@@ -4149,13 +4039,12 @@ class TestDummyCommunication(ExtendedTestCase):
         )
 
     def testWriteRegisterWrongType(self) -> None:
+        write_register = self.instrument.write_register
         for value in _NOT_NUMERICALS:
-            self.assertRaises(TypeError, self.instrument.write_register, value, 20)
-            self.assertRaises(TypeError, self.instrument.write_register, 35, value)
-            self.assertRaises(TypeError, self.instrument.write_register, 35, 20, value)
-            self.assertRaises(
-                TypeError, self.instrument.write_register, 35, 20, functioncode=value
-            )
+            self.assertRaises(TypeError, write_register, value, 20)
+            self.assertRaises(TypeError, write_register, 35, value)
+            self.assertRaises(TypeError, write_register, 35, 20, value)
+            self.assertRaises(TypeError, write_register, 35, 20, functioncode=value)
 
     def testWriteRegisterWithWrongCrcResponse(self) -> None:
         # Slave gives wrong CRC
@@ -4232,15 +4121,14 @@ class TestDummyCommunication(ExtendedTestCase):
         )
 
     def testReadLongWrongType(self) -> None:
+        read_long = self.instrument.read_long
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.read_long, value)
-            self.assertRaises(TypeError, self.instrument.read_long, 102, value)
-            self.assertRaises(
-                TypeError, self.instrument.read_long, 102, 3, False, value
-            )
+            self.assertRaises(TypeError, read_long, value)
+            self.assertRaises(TypeError, read_long, 102, value)
+            self.assertRaises(TypeError, read_long, 102, 3, False, value)
             self.assertRaises(
                 TypeError,
-                self.instrument.read_long,
+                read_long,
                 102,
                 3,
                 False,
@@ -4248,7 +4136,7 @@ class TestDummyCommunication(ExtendedTestCase):
                 value,
             )
         for value in _NOT_BOOLEANS:
-            self.assertRaises(TypeError, self.instrument.read_long, 102, 3, value)
+            self.assertRaises(TypeError, read_long, 102, 3, value)
 
     # Write Long #
 
@@ -4323,12 +4211,13 @@ class TestDummyCommunication(ExtendedTestCase):
         )
 
     def testWriteLongWrongType(self) -> None:
+        write_long = self.instrument.write_long
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.write_long, value, 5)
-            self.assertRaises(TypeError, self.instrument.write_long, 102, value)
+            self.assertRaises(TypeError, write_long, value, 5)
+            self.assertRaises(TypeError, write_long, 102, value)
             self.assertRaises(
                 TypeError,
-                self.instrument.write_long,
+                write_long,
                 102,
                 5,
                 False,
@@ -4336,9 +4225,7 @@ class TestDummyCommunication(ExtendedTestCase):
                 value,
             )
         for value in _NOT_BOOLEANS:
-            self.assertRaises(
-                TypeError, self.instrument.write_long, 102, 5, signed=value
-            )
+            self.assertRaises(TypeError, write_long, 102, 5, signed=value)
 
     # Read Float #
 
@@ -4379,10 +4266,11 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.read_float, 103, 3, 3)
 
     def testReadFloatWrongType(self) -> None:
+        read_float = self.instrument.read_float
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.read_float, value, 3, 2)
-            self.assertRaises(TypeError, self.instrument.read_float, 103, value, 2)
-            self.assertRaises(TypeError, self.instrument.read_float, 103, 3, value)
+            self.assertRaises(TypeError, read_float, value, 3, 2)
+            self.assertRaises(TypeError, read_float, 103, value, 2)
+            self.assertRaises(TypeError, read_float, 103, 3, value)
 
     # Write Float #
 
@@ -4407,11 +4295,12 @@ class TestDummyCommunication(ExtendedTestCase):
             self.assertRaises(ValueError, self.instrument.write_float, 103, 1.1, value)
 
     def testWriteFloatWrongType(self) -> None:
+        write_float = self.instrument.write_float
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.write_float, value, 1.1)
-            self.assertRaises(TypeError, self.instrument.write_float, 103, 1.1, value)
+            self.assertRaises(TypeError, write_float, value, 1.1)
+            self.assertRaises(TypeError, write_float, 103, 1.1, value)
         for value in _NOT_NUMERICALS:
-            self.assertRaises(TypeError, self.instrument.write_float, 103, value)
+            self.assertRaises(TypeError, write_float, 103, value)
 
     # Read String #
 
@@ -4434,11 +4323,12 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.read_string, 104, 4, 256)
 
     def testReadStringWrongType(self) -> None:
+        read_string = self.instrument.read_string
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.read_string, value, 1)
-            self.assertRaises(TypeError, self.instrument.read_string, value, 4)
-            self.assertRaises(TypeError, self.instrument.read_string, 104, value)
-            self.assertRaises(TypeError, self.instrument.read_string, 104, 4, value)
+            self.assertRaises(TypeError, read_string, value, 1)
+            self.assertRaises(TypeError, read_string, value, 4)
+            self.assertRaises(TypeError, read_string, 104, value)
+            self.assertRaises(TypeError, read_string, 104, 4, value)
 
     # Write String #
 
@@ -4461,11 +4351,12 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.write_string, 104, "\u0394P", 1)
 
     def testWriteStringWrongType(self) -> None:
+        write_string = self.instrument.write_string
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.write_string, value, "A")
-            self.assertRaises(TypeError, self.instrument.write_string, 104, "A", value)
+            self.assertRaises(TypeError, write_string, value, "A")
+            self.assertRaises(TypeError, write_string, 104, "A", value)
         for value in _NOT_STRINGS:
-            self.assertRaises(TypeError, self.instrument.write_string, 104, value, 4)
+            self.assertRaises(TypeError, write_string, 104, value, 4)
 
     # Read Registers #
 
@@ -4487,10 +4378,11 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.read_registers, 105, 1, -1)
 
     def testReadRegistersWrongType(self) -> None:
+        read_registers = self.instrument.read_registers
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.read_registers, value, 1)
-            self.assertRaises(TypeError, self.instrument.read_registers, 105, value)
-            self.assertRaises(TypeError, self.instrument.read_registers, 105, 1, value)
+            self.assertRaises(TypeError, read_registers, value, 1)
+            self.assertRaises(TypeError, read_registers, 105, value)
+            self.assertRaises(TypeError, read_registers, 105, 1, value)
 
     # Write Registers #
 
@@ -4511,10 +4403,11 @@ class TestDummyCommunication(ExtendedTestCase):
         self.assertRaises(ValueError, self.instrument.write_registers, 105, [2] * 124)
 
     def testWriteRegistersWrongType(self) -> None:
+        write_registers = self.instrument.write_registers
         for value in _NOT_INTERGERS:
-            self.assertRaises(TypeError, self.instrument.write_registers, value, [2])
+            self.assertRaises(TypeError, write_registers, value, [2])
         for value in _NOT_INTLISTS:
-            self.assertRaises(TypeError, self.instrument.write_registers, 105, value)
+            self.assertRaises(TypeError, write_registers, 105, value)
 
     # Generic command #
 
@@ -4971,55 +4864,41 @@ class TestDummyCommunication(ExtendedTestCase):
     # Perform command #
 
     def testPerformcommandKnownResponse(self) -> None:
+        perform_command = self.instrument._perform_command
         # Total response length should be 8 bytes
-        self.assertEqual(self.instrument._perform_command(16, b"TESTCOMMAND"), b"TRsp")
+        self.assertEqual(perform_command(16, b"TESTCOMMAND"), b"TRsp")
         self.assertEqual(
-            self.instrument._perform_command(75, b"TESTCOMMAND2"),
+            perform_command(75, b"TESTCOMMAND2"),
             b"TESTCOMMANDRESPONSE2",
         )
         # Read bit register 61 on slave 1 using function code 2.
-        self.assertEqual(
-            self.instrument._perform_command(2, b"\x00\x3d\x00\x01"), b"\x01\x01"
-        )
+        self.assertEqual(perform_command(2, b"\x00\x3d\x00\x01"), b"\x01\x01")
 
     def testPerformcommandWrongSlaveResponse(self) -> None:
+        perform_command = self.instrument._perform_command
         # Wrong slave address in response
-        self.assertRaises(
-            InvalidResponseError, self.instrument._perform_command, 1, b"TESTCOMMAND"
-        )
+        self.assertRaises(InvalidResponseError, perform_command, 1, b"TESTCOMMAND")
         # Wrong function code in response
-        self.assertRaises(
-            InvalidResponseError, self.instrument._perform_command, 2, b"TESTCOMMAND"
-        )
+        self.assertRaises(InvalidResponseError, perform_command, 2, b"TESTCOMMAND")
         # Wrong CRC in response
-        self.assertRaises(
-            InvalidResponseError, self.instrument._perform_command, 3, b"TESTCOMMAND"
-        )
+        self.assertRaises(InvalidResponseError, perform_command, 3, b"TESTCOMMAND")
         # Too short response message from slave
-        self.assertRaises(
-            InvalidResponseError, self.instrument._perform_command, 4, b"TESTCOMMAND"
-        )
+        self.assertRaises(InvalidResponseError, perform_command, 4, b"TESTCOMMAND")
         # Error indication from slave
-        self.assertRaises(
-            InvalidResponseError, self.instrument._perform_command, 5, b"TESTCOMMAND"
-        )
+        self.assertRaises(InvalidResponseError, perform_command, 5, b"TESTCOMMAND")
 
     def testPerformcommandWrongInputValue(self) -> None:
+        perform_command = self.instrument._perform_command
         # Wrong function code
-        self.assertRaises(
-            ValueError, self.instrument._perform_command, -1, b"TESTCOMMAND"
-        )
-        self.assertRaises(
-            ValueError, self.instrument._perform_command, 128, b"TESTCOMMAND"
-        )
+        self.assertRaises(ValueError, perform_command, -1, b"TESTCOMMAND")
+        self.assertRaises(ValueError, perform_command, 128, b"TESTCOMMAND")
 
     def testPerformcommandWrongInputType(self) -> None:
+        perform_command = self.instrument._perform_command
         for value in _NOT_INTERGERS:
-            self.assertRaises(
-                TypeError, self.instrument._perform_command, value, b"TESTCOMMAND"
-            )
+            self.assertRaises(TypeError, perform_command, value, b"TESTCOMMAND")
         for value in _NOT_BYTES:
-            self.assertRaises(TypeError, self.instrument._perform_command, 16, value)
+            self.assertRaises(TypeError, perform_command, 16, value)
 
     # Communicate #
 
@@ -5030,10 +4909,9 @@ class TestDummyCommunication(ExtendedTestCase):
         )
 
     def testCommunicateWrongType(self) -> None:
+        communicate = self.instrument._communicate
         for value in _NOT_BYTES:
-            self.assertRaises(
-                TypeError, self.instrument._communicate, value, _LARGE_NUMBER_OF_BYTES
-            )
+            self.assertRaises(TypeError, communicate, value, _LARGE_NUMBER_OF_BYTES)
 
     def testCommunicateNoMessage(self) -> None:
         self.assertRaises(
@@ -5582,19 +5460,17 @@ class TestDummyCommunicationExternalSerialPortWrongType(ExtendedTestCase):
         )
 
 
-RTU_RESPONSES: Dict[bytes, bytes] = {}
 GOOD_RTU_RESPONSES: Dict[bytes, bytes] = {}
 WRONG_RTU_RESPONSES: Dict[bytes, bytes] = {}
-ASCII_RESPONSES: Dict[bytes, bytes] = {}
 GOOD_ASCII_RESPONSES: Dict[bytes, bytes] = {}
 WRONG_ASCII_RESPONSES: Dict[bytes, bytes] = {}
 """A dictionary of respones from a dummy instrument.
 
-The key is the message (string) sent to the serial port, and the item is the response
-(string) from the dummy serial port.
+The key is the message (bytes) sent to the serial port, and the item is the response
+(bytes) from the dummy serial port.
 """
-# Note that the string 'AAAAAAA' might be easier to read if grouped,
-# like 'AA' + 'AAAA' + 'A' for the initial part (address etc) + payload + CRC.
+# Note that the bytes b'AAAAAAA' might be easier to read if grouped,
+# like b'AA' + b'AAAA' + b'A' for the initial part (address etc) + payload + CRC.
 
 
 #                ##  READ BIT  ##
@@ -6661,10 +6537,14 @@ GOOD_ASCII_RESPONSES[b":0703102F0001B6\r\n"] = b":070302019063\r\n"
 # Group recorded data #
 #######################
 
-RTU_RESPONSES.update(WRONG_RTU_RESPONSES)
-RTU_RESPONSES.update(GOOD_RTU_RESPONSES)
-ASCII_RESPONSES.update(WRONG_ASCII_RESPONSES)
-ASCII_RESPONSES.update(GOOD_ASCII_RESPONSES)
+# The good responses take precedence. Lookups are delegated, so nothing is copied.
+# Read-only, as the same mappings are shared by all tests.
+RTU_RESPONSES = types.MappingProxyType(
+    collections.ChainMap(GOOD_RTU_RESPONSES, WRONG_RTU_RESPONSES)
+)
+ASCII_RESPONSES = types.MappingProxyType(
+    collections.ChainMap(GOOD_ASCII_RESPONSES, WRONG_ASCII_RESPONSES)
+)
 
 #################
 # Run the tests #